@@ -25,6 +25,14 @@ const KNOWN_EVENT_TYPES: ReadonlySet<string> = new Set([
   "item.completed",
   "error",
 ]);
+const TOML_ESCAPE_REGEX = /[\\"\n\r\t]/g;
+const TOML_ESCAPES: Readonly<Record<string, string>> = {
+  "\\": "\\\\",
+  '"': '\\"',
+  "\n": "\\n",
+  "\r": "\\r",
+  "\t": "\\t",
+};
 
 export interface CodexCliAdapterOptions {
   binary?: string;
@@ -57,12 +65,7 @@ function normalizeSpawnEnv(env: NodeJS.ProcessEnv | undefined): Record<string, s
 
 function tomlStringLiteral(value: string): string {
   const raw = String(value ?? "");
-  const escaped = raw
-    .replace(/\\/g, "\\\\")
-    .replace(/"/g, '\\"')
-    .replace(/\n/g, "\\n")
-    .replace(/\r/g, "\\r")
-    .replace(/\t/g, "\\t");
+  const escaped = raw.replace(TOML_ESCAPE_REGEX, (ch) => TOML_ESCAPES[ch]);
   return `"${escaped}"`;
 }
 
@@ -10,10 +10,20 @@ const DEFAULT_SKILLS_DIR = path.join(PROJECT_ROOT, "templates", "skills");
 interface FileCache {
   path: string;
   mtimeMs: number;
+  size: number;
   hash: string;
   content: string;
 }
 
+// Shared across loader instances so each bootstrap run reuses skill files read by earlier runs.
+// Keyed by skill file path; the oldest entries are evicted once the cap is reached.
+const MAX_SHARED_FILE_CACHE_ENTRIES = 256;
+const sharedFileCache = new Map<string, FileCache>();
+
+export function resetSkillLoaderFileCacheForTests(): void {
+  sharedFileCache.clear();
+}
+
 export interface SkillLoadResult {
   name: string;
   text: string;
@@ -33,7 +43,6 @@ function resolveDefaultSkillPath(name: string): string {
 
 export class SkillLoader {
   private readonly logger: Logger;
-  private readonly cacheByPath = new Map<string, FileCache>();
   private readonly warnedMissingWorkspace = new Set<string>();
   private readonly warnedMissingDefault = new Set<string>();
 
@@ -76,28 +85,35 @@ export class SkillLoader {
   }
 
   private readFileWithCache(filePath: string, required: boolean, label: string): FileCache {
-    const cached = this.cacheByPath.get(filePath) ?? null;
+    const cached = sharedFileCache.get(filePath) ?? null;
     try {
       const stats = fs.statSync(filePath);
-      if (cached && cached.mtimeMs === stats.mtimeMs) {
+      if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
         return cached;
       }
       const content = fs.readFileSync(filePath, "utf8");
       const next: FileCache = {
         path: filePath,
         mtimeMs: stats.mtimeMs,
+        size: stats.size,
         content,
         hash: crypto.createHash("sha1").update(content).digest("hex"),
       };
-      this.cacheByPath.set(filePath, next);
+      sharedFileCache.delete(filePath);
+      if (sharedFileCache.size >= MAX_SHARED_FILE_CACHE_ENTRIES) {
+        const oldest = sharedFileCache.keys().next().value;
+        if (oldest !== undefined) {
+          sharedFileCache.delete(oldest);
+        }
+      }
+      sharedFileCache.set(filePath, next);
       return next;
     } catch (error) {
+      sharedFileCache.delete(filePath);
       if (required) {
         throw new Error(`[SkillLoader] failed to read ${label}: ${filePath}`, error instanceof Error ? { cause: error } : undefined);
       }
-      const missing: FileCache = { path: filePath, mtimeMs: 0, content: "", hash: "missing" };
-      this.cacheByPath.set(filePath, missing);
-      return missing;
+      return { path: filePath, mtimeMs: 0, size: 0, content: "", hash: "missing" };
     }
   }
 }
@@ -24,13 +24,16 @@ import { ScheduleStore } from "./store.js";
 import type { StoredSchedule } from "./store.js";
 
 const defaultLogger = createLogger("SchedulerRuntime");
+const IDEMPOTENCY_KEY_PLACEHOLDER_REGEX = /\{(scheduleId|runAtIso)\}/g;
 
 function renderIdempotencyKey(template: string, scheduleId: string, runAtIso: string): string {
   const t = String(template ?? "").trim();
   if (!t) {
     return `sch:${scheduleId}:${runAtIso}`;
   }
-  const replaced = t.replaceAll("{scheduleId}", scheduleId).replaceAll("{runAtIso}", runAtIso);
+  const replaced = t.replace(IDEMPOTENCY_KEY_PLACEHOLDER_REGEX, (_placeholder: string, key: string) =>
+    key === "scheduleId" ? scheduleId : runAtIso,
+  );
   return replaced || `sch:${scheduleId}:${runAtIso}`;
 }
 
@@ -6,6 +6,10 @@ import os from "node:os";
 
 const MAX_SKILL_NAME_LENGTH = 64;
 const ALLOWED_RESOURCES = new Set(["scripts", "references", "assets"]);
+const TEMPLATE_PLACEHOLDER_REGEX = /\{(\w+)\}/g;
+const NON_SLUG_CHARS_REGEX = /[^a-z0-9]+/g;
+const EDGE_HYPHENS_REGEX = /^-+|-+$/g;
+const REPEATED_HYPHENS_REGEX = /-{2,}/g;
 
 const SKILL_TEMPLATE = `---
 name: {skill_name}
@@ -62,9 +66,9 @@ the output the agent produces.
 
 function normalizeSkillName(raw: string): string {
   let normalized = raw.trim().toLowerCase();
-  normalized = normalized.replace(/[^a-z0-9]+/g, "-");
-  normalized = normalized.replace(/^-+|-+$/g, "");
-  normalized = normalized.replace(/-{2,}/g, "-");
+  normalized = normalized.replace(NON_SLUG_CHARS_REGEX, "-");
+  normalized = normalized.replace(EDGE_HYPHENS_REGEX, "");
+  normalized = normalized.replace(REPEATED_HYPHENS_REGEX, "-");
   return normalized;
 }
 
@@ -83,11 +87,9 @@ function expandTilde(p: string): string {
 }
 
 function fillTemplate(template: string, vars: Record<string, string>): string {
-  let result = template;
-  for (const [key, value] of Object.entries(vars)) {
-    result = result.replaceAll(`{${key}}`, value);
-  }
-  return result;
+  return template.replace(TEMPLATE_PLACEHOLDER_REGEX, (placeholder: string, key: string) =>
+    Object.hasOwn(vars, key) ? vars[key] : placeholder,
+  );
 }
 
 function parseResources(raw: string): string[] {
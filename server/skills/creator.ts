@@ -8,6 +8,10 @@ const MAX_SKILL_NAME_LENGTH = 64;
 const MAX_DESCRIPTION_LENGTH = 1024;
 const ALLOWED_RESOURCE_DIRS = new Set(["scripts", "references", "assets"]);
 const ALLOWED_FRONTMATTER_KEYS = new Set(["name", "description", "metadata"]);
+const TEMPLATE_PLACEHOLDER_REGEX = /\{(\w+)\}/g;
+const NON_SLUG_CHARS_REGEX = /[^a-z0-9]+/g;
+const EDGE_HYPHENS_REGEX = /^-+|-+$/g;
+const REPEATED_HYPHENS_REGEX = /-{2,}/g;
 
 const SKILL_TEMPLATE = `---
 name: {skill_name}
@@ -62,6 +66,12 @@ Asset files are NOT intended to be loaded into context, but rather used within
 the output the agent produces.
 `;
 
+const RESOURCE_EXAMPLES: Readonly<Record<string, { fileName: string; template: string; mode?: number }>> = {
+  scripts: { fileName: "example.py", template: EXAMPLE_SCRIPT, mode: 0o755 },
+  references: { fileName: "api_reference.md", template: EXAMPLE_REFERENCE },
+  assets: { fileName: "example_asset.txt", template: EXAMPLE_ASSET },
+};
+
 export interface InitSkillParams {
   workspaceRoot: string;
   rawName: string;
@@ -97,9 +107,9 @@ export interface SavedSkillDraft {
 
 export function normalizeSkillName(raw: string): string {
   let normalized = raw.trim().toLowerCase();
-  normalized = normalized.replace(/[^a-z0-9]+/g, "-");
-  normalized = normalized.replace(/^-+|-+$/g, "");
-  normalized = normalized.replace(/-{2,}/g, "-");
+  normalized = normalized.replace(NON_SLUG_CHARS_REGEX, "-");
+  normalized = normalized.replace(EDGE_HYPHENS_REGEX, "");
+  normalized = normalized.replace(REPEATED_HYPHENS_REGEX, "-");
   return normalized;
 }
 
@@ -200,31 +210,17 @@ export function initSkill(params: InitSkillParams): InitSkillResult {
       const resourceDir = path.join(skillDir, resource);
       fs.mkdirSync(resourceDir, { recursive: true });
 
-      if (!params.includeExamples) {
-        continue;
-      }
-
-      if (resource === "scripts") {
-        const filePath = path.join(resourceDir, "example.py");
-        fs.writeFileSync(filePath, fillTemplate(EXAMPLE_SCRIPT, vars), "utf8");
-        fs.chmodSync(filePath, 0o755);
-        createdFiles.push(filePath);
+      const example = params.includeExamples ? RESOURCE_EXAMPLES[resource] : undefined;
+      if (!example) {
         continue;
       }
 
-      if (resource === "references") {
-        const filePath = path.join(resourceDir, "api_reference.md");
-        fs.writeFileSync(filePath, fillTemplate(EXAMPLE_REFERENCE, vars), "utf8");
-        createdFiles.push(filePath);
-        continue;
-      }
-
-      if (resource === "assets") {
-        const filePath = path.join(resourceDir, "example_asset.txt");
-        fs.writeFileSync(filePath, EXAMPLE_ASSET, "utf8");
-        createdFiles.push(filePath);
-        continue;
+      const filePath = path.join(resourceDir, example.fileName);
+      fs.writeFileSync(filePath, fillTemplate(example.template, vars), "utf8");
+      if (example.mode !== undefined) {
+        fs.chmodSync(filePath, example.mode);
       }
+      createdFiles.push(filePath);
     }
   }
 
@@ -358,11 +354,12 @@ export function saveSkillDraftFromBlock(params: SaveSkillDraftParams): SavedSkil
 }
 
 function fillTemplate(template: string, vars: Record<string, string>): string {
-  let result = template;
-  for (const [key, value] of Object.entries(vars)) {
-    result = result.replaceAll(`{${key}}`, value);
+  if (!template.includes("{") || Object.keys(vars).length === 0) {
+    return template;
   }
-  return result;
+  return template.replace(TEMPLATE_PLACEHOLDER_REGEX, (placeholder: string, key: string) =>
+    Object.hasOwn(vars, key) ? vars[key] : placeholder,
+  );
 }
 
 function expandTilde(value: string): string {
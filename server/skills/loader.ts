@@ -20,10 +20,10 @@ const SKILL_FILE_NAME = "SKILL.md";
 const WORKSPACE_SKILLS_METADATA_FILE = "metadata.yaml";
 
 export interface SkillMetadata {
-  name: string;
-  description: string;
-  location: string;
-  source: "workspace" | "ads" | "state" | "global" | "builtin";
+  readonly name: string;
+  readonly description: string;
+  readonly location: string;
+  readonly source: "workspace" | "ads" | "state" | "global" | "builtin";
 }
 
 function isWorkspaceSkillsEnabled(workspacePath: string): boolean {
@@ -40,11 +40,12 @@ function isWorkspaceSkillsEnabled(workspacePath: string): boolean {
   }
 }
 
+// Entries (and their meta objects) are handed out to callers by reference, so they are never mutated in place.
 interface SkillFileCacheEntry {
-  mtimeMs: number;
-  size: number;
-  content: string;
-  meta: SkillMetadata | null;
+  readonly mtimeMs: number;
+  readonly size: number;
+  readonly content: string;
+  readonly meta: SkillMetadata | null;
 }
 
 const skillFileCache = new Map<string, SkillFileCacheEntry>();
@@ -127,21 +128,16 @@ export function discoverSkills(workspacePath: string, builtinRoot?: string): Ski
   const byName = new Map<string, SkillMetadata>();
 
   for (const { dir, source } of roots) {
-    if (!fs.existsSync(dir)) {
-      continue;
-    }
-
     let entries: fs.Dirent[];
     try {
+      // Missing roots are common (global/workspace dirs); readdir failing is cheaper than probing first.
       entries = fs.readdirSync(dir, { withFileTypes: true });
     } catch {
       continue;
     }
 
-    for (const entry of entries.sort((a, b) => a.name.localeCompare(b.name))) {
-      if (!entry.isDirectory()) {
-        continue;
-      }
+    const skillDirs = entries.filter((entry) => entry.isDirectory());
+    for (const entry of skillDirs.sort((a, b) => a.name.localeCompare(b.name))) {
       const skillFile = path.join(dir, entry.name, SKILL_FILE_NAME);
       const meta = readSkillFileWithCache(skillFile, source)?.meta ?? null;
       if (meta === null) {
@@ -160,13 +156,21 @@ export function discoverSkills(workspacePath: string, builtinRoot?: string): Ski
 }
 
 export function loadSkillBody(name: string, workspacePath: string, builtinRoot?: string): string | null {
-  const lowered = name.toLowerCase();
-  for (const skill of discoverSkills(workspacePath, builtinRoot)) {
-    if (skill.name.toLowerCase() === lowered) {
-      return readSkillFileWithCache(skill.location, skill.source)?.content ?? null;
-    }
+  return readSkillBodies([name], discoverSkills(workspacePath, builtinRoot)).get(name) ?? null;
+}
+
+export function readSkillBodies(names: string[], skills: readonly SkillMetadata[]): Map<string, string | null> {
+  const byName = new Map<string, SkillMetadata>();
+  for (const skill of skills) {
+    byName.set(skill.name.toLowerCase(), skill);
+  }
+
+  const bodies = new Map<string, string | null>();
+  for (const name of names) {
+    const skill = byName.get(name.toLowerCase());
+    bodies.set(name, skill ? readSkillFileWithCache(skill.location, skill.source)?.content ?? null : null);
   }
-  return null;
+  return bodies;
 }
 
 export function getSkillFileCacheSizeForTests(): number {
@@ -228,14 +232,17 @@ export function renderSkillList(skills: SkillMetadata[]): string {
 }
 
 function parseFrontmatter(content: string): Record<string, unknown> {
-  const lines = content.split("\n");
-  if (!lines.length || lines[0].trim() !== "---") {
+  // Walk line boundaries with indexOf so only the frontmatter block is scanned, not the whole body.
+  const firstBreak = content.indexOf("\n");
+  if (firstBreak === -1 || content.slice(0, firstBreak).trim() !== "---") {
     return {};
   }
 
-  for (let i = 1; i < lines.length; i++) {
-    if (lines[i].trim() === "---") {
-      const payload = lines.slice(1, i).join("\n");
+  for (let lineStart = firstBreak + 1; lineStart <= content.length; ) {
+    const nextBreak = content.indexOf("\n", lineStart);
+    const lineEnd = nextBreak === -1 ? content.length : nextBreak;
+    if (content.slice(lineStart, lineEnd).trim() === "---") {
+      const payload = content.slice(firstBreak + 1, lineStart - 1);
       try {
         const parsed = yaml.parse(payload);
         if (parsed && typeof parsed === "object" && !Array.isArray(parsed)) {
@@ -250,6 +257,7 @@ function parseFrontmatter(content: string): Record<string, unknown> {
       }
       return {};
     }
+    lineStart = lineEnd + 1;
   }
   return {};
 }
@@ -34,7 +34,15 @@ type CachedRegistry = {
   registry: SkillRegistry;
 };
 
+type CachedRegistryFile = {
+  mtimeMs: number;
+  size: number;
+  registry: SkillRegistry;
+};
+
 let cached: CachedRegistry | null = null;
+// Parsed metadata files by path, so switching workspaces does not re-parse the shared base file.
+const registryFileCache = new Map<string, CachedRegistryFile>();
 
 function isWorkspaceSkillsEnabled(workspaceRoot?: string): boolean {
   const enabled = parseOptionalBooleanFlag(process.env.ADS_ENABLE_WORKSPACE_SKILLS);
@@ -109,14 +117,14 @@ export function loadSkillRegistry(workspaceRoot?: string): SkillRegistry | null
   }
 
   const signature = overlayStat
-    ? `${metadataPath}:${stat.mtimeMs}|${overlayPath!}:${overlayStat.mtimeMs}`
-    : `${metadataPath}:${stat.mtimeMs}`;
+    ? `${metadataPath}:${stat.mtimeMs}:${stat.size}|${overlayPath!}:${overlayStat.mtimeMs}:${overlayStat.size}`
+    : `${metadataPath}:${stat.mtimeMs}:${stat.size}`;
 
   if (cached && cached.signature === signature) {
     return cached.registry;
   }
 
-  const baseRegistry = loadSkillRegistryFromPath(metadataPath);
+  const baseRegistry = loadCachedSkillRegistryFromPath(metadataPath, stat);
   if (!baseRegistry) {
     cached = null;
     return null;
@@ -124,7 +132,7 @@ export function loadSkillRegistry(workspaceRoot?: string): SkillRegistry | null
 
   let registry = baseRegistry;
   if (overlayStat && overlayPath) {
-    const overlayRegistry = loadSkillRegistryFromPath(overlayPath);
+    const overlayRegistry = loadCachedSkillRegistryFromPath(overlayPath, overlayStat);
     if (overlayRegistry) {
       registry = mergeRegistries(registry, overlayRegistry);
     }
@@ -142,6 +150,20 @@ function mergeRegistries(base: SkillRegistry, overlay: SkillRegistry): SkillRegi
   return { mode: overlay.mode, skills };
 }
 
+function loadCachedSkillRegistryFromPath(metadataPath: string, stat: fs.Stats): SkillRegistry | null {
+  const hit = registryFileCache.get(metadataPath);
+  if (hit && hit.mtimeMs === stat.mtimeMs && hit.size === stat.size) {
+    return hit.registry;
+  }
+  const registry = loadSkillRegistryFromPath(metadataPath);
+  if (registry) {
+    registryFileCache.set(metadataPath, { mtimeMs: stat.mtimeMs, size: stat.size, registry });
+  } else {
+    registryFileCache.delete(metadataPath);
+  }
+  return registry;
+}
+
 function loadSkillRegistryFromPath(metadataPath: string): SkillRegistry | null {
   let raw: string;
   try {
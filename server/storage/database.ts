@@ -154,6 +154,7 @@ export function getDatabase(workspacePath?: string): DatabaseType {
 
   const db = new DatabaseConstructor(dbPath, { readonly: false, fileMustExist: false });
   db.pragma("journal_mode = WAL");
+  db.pragma("synchronous = NORMAL");
   db.pragma("foreign_keys = ON");
   const busyTimeoutMs = parseNonNegativeIntFlag(
     process.env.ADS_SQLITE_BUSY_TIMEOUT_MS,
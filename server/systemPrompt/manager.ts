@@ -6,8 +6,8 @@ import { createLogger, type Logger } from "../utils/logger.js";
 import { parseOptionalBooleanFlag } from "../utils/flags.js";
 import { migrateLegacyWorkspaceAdsIfNeeded, resolveWorkspaceStatePath } from "../workspace/adsPaths.js";
 import { detectWorkspaceFrom } from "../workspace/detector.js";
-import { discoverSkills, loadSkillBody, renderSkillMetaInstruction } from "../skills/loader.js";
-import { readSoul } from "../memory/soul.js";
+import { discoverSkills, readSkillBodies, renderSkillMetaInstruction, type SkillMetadata } from "../skills/loader.js";
+import { resolveSoulPath } from "../memory/soul.js";
 import { PROJECT_ROOT } from "../utils/projectRoot.js";
 const DEFAULT_INSTRUCTIONS_PATH = path.join(PROJECT_ROOT, "templates", "instructions.md");
 
@@ -26,6 +26,7 @@ export interface SystemPromptManagerOptions {
 interface FileCache {
   path: string;
   mtimeMs: number;
+  size: number;
   hash: string;
   content: string;
 }
@@ -37,6 +38,19 @@ export interface PromptInjection {
   rulesHash: string;
 }
 
+// Shared across manager instances so concurrent sessions on one workspace read and hash each file once.
+// Keyed by prompt file path; the oldest entries are evicted once the cap is reached.
+const MAX_SHARED_FILE_CACHE_ENTRIES = 256;
+const sharedFileCache = new Map<string, FileCache>();
+
+export function getSystemPromptFileCacheSizeForTests(): number {
+  return sharedFileCache.size;
+}
+
+export function resetSystemPromptFileCacheForTests(): void {
+  sharedFileCache.clear();
+}
+
 function shortHash(hash: string): string {
   return hash.slice(0, 8);
 }
@@ -80,8 +94,6 @@ export class SystemPromptManager {
   private readonly logger: Logger;
   private readonly reinjection: ReinjectionConfig;
   private readonly rulesReinjectionTurns: number;
-  private instructionsCache: FileCache | null = null;
-  private rulesCache: FileCache | null = null;
   private lastSoulHash: string | null = null;
   private lastSkillsHash: string | null = null;
   private requestedSkillNames: string[] = [];
@@ -121,8 +133,6 @@ export class SystemPromptManager {
     }
     this.workspaceRoot = normalized;
     this.workspaceInitialized = this.checkWorkspaceInitialized(normalized);
-    this.instructionsCache = null;
-    this.rulesCache = null;
     this.lastSoulHash = null;
     this.lastSkillsHash = null;
     this.requestedSkillNames = [];
@@ -156,8 +166,10 @@ export class SystemPromptManager {
     // 先刷新缓存以捕获指令/规则变更，确保 pendingReason 在本次判断前就绪
     const instructionsCache = this.readInstructions();
     const rulesCache = this.readRules();
-    const soulHash = this.computeSoulHash();
-    const skillsHash = this.computeSkillsHash();
+    const soulCache = this.readSoul();
+    const soulHash = soulCache.hash;
+    const skills = this.discoverWorkspaceSkills();
+    const skillsHash = this.computeSkillsHash(skills);
 
     if (this.hasInjected) {
       if (this.lastSoulHash && soulHash !== this.lastSoulHash) {
@@ -188,15 +200,15 @@ export class SystemPromptManager {
     if (rules.content.trim()) {
       textParts.push(rules.content.trim());
     }
-    const skillsBlock = this.renderSkillsBlock();
+    const skillsBlock = this.renderSkillsBlock(skills);
     if (skillsBlock) {
       textParts.push(skillsBlock);
     }
-    const requestedSkillsBlock = this.renderRequestedSkillsBlock();
+    const requestedSkillsBlock = this.renderRequestedSkillsBlock(skills);
     if (requestedSkillsBlock) {
       textParts.push(requestedSkillsBlock);
     }
-    const soulBlock = this.renderSoulBlock();
+    const soulBlock = this.renderSoulBlock(soulCache);
     if (soulBlock) {
       textParts.push(soulBlock);
     }
@@ -234,35 +246,34 @@ export class SystemPromptManager {
     this.turnCount += 1;
   }
 
-  private renderSkillsBlock(): string | null {
+  private discoverWorkspaceSkills(): SkillMetadata[] | null {
     try {
-      const skills = discoverSkills(this.workspaceRoot);
-      return renderSkillMetaInstruction(skills);
+      return discoverSkills(this.workspaceRoot);
     } catch {
       return null;
     }
   }
 
-  private renderSoulBlock(): string | null {
-    try {
-      const content = readSoul(this.workspaceRoot);
-      const trimmed = content.trim();
-      if (!trimmed) {
-        return null;
-      }
-      return `<soul>\n${trimmed}\n</soul>`;
-    } catch {
+  private renderSkillsBlock(skills: SkillMetadata[] | null): string | null {
+    return skills ? renderSkillMetaInstruction(skills) : null;
+  }
+
+  private renderSoulBlock(soul: FileCache): string | null {
+    const trimmed = soul.content.trim();
+    if (!trimmed) {
       return null;
     }
+    return `<soul>\n${trimmed}\n</soul>`;
   }
 
-  private renderRequestedSkillsBlock(): string | null {
+  private renderRequestedSkillsBlock(skills: SkillMetadata[] | null): string | null {
     if (this.requestedSkillNames.length === 0) {
       return null;
     }
+    const bodies = readSkillBodies(this.requestedSkillNames, skills ?? []);
     const parts = ["<requested_skills>"];
     for (const name of this.requestedSkillNames) {
-      const body = loadSkillBody(name, this.workspaceRoot);
+      const body = bodies.get(name) ?? null;
       if (!body) {
         parts.push(`  <skill name="${name}" missing="true" />`);
         continue;
@@ -275,23 +286,9 @@ export class SystemPromptManager {
     return parts.join("\n");
   }
 
-  private computeSoulHash(): string {
-    try {
-      const content = readSoul(this.workspaceRoot);
-      return crypto.createHash("sha1").update(content ?? "").digest("hex");
-    } catch {
-      return crypto.createHash("sha1").update("").digest("hex");
-    }
-  }
-
-  private computeSkillsHash(): string {
-    try {
-      const skills = discoverSkills(this.workspaceRoot);
-      const payload = skills.map((s) => ({ name: s.name, description: s.description, source: s.source }));
-      return crypto.createHash("sha1").update(JSON.stringify(payload)).digest("hex");
-    } catch {
-      return crypto.createHash("sha1").update("[]").digest("hex");
-    }
+  private computeSkillsHash(skills: SkillMetadata[] | null): string {
+    const payload = (skills ?? []).map((s) => ({ name: s.name, description: s.description, source: s.source }));
+    return crypto.createHash("sha1").update(JSON.stringify(payload)).digest("hex");
   }
 
   private computeInjectionReason(): string | null {
@@ -330,22 +327,12 @@ export class SystemPromptManager {
     const instructionsPath = resolveWorkspaceStatePath(this.workspaceRoot, "templates", "instructions.md");
 
     // Always check workspace instructions first to allow hot-loading after fallback
-    const workspaceCache = this.readFileWithCache(
-      instructionsPath,
-      false,
-      "instructions",
-      this.instructionsCache?.path === instructionsPath ? this.instructionsCache : null,
-    );
+    const workspaceCache = this.readFileWithCache(instructionsPath, false, "instructions");
 
     let cache = workspaceCache;
 
     if (workspaceCache.hash === "missing") {
-      const fallbackCache = this.readFileWithCache(
-        DEFAULT_INSTRUCTIONS_PATH,
-        false,
-        "default instructions",
-        this.instructionsCache?.path === DEFAULT_INSTRUCTIONS_PATH ? this.instructionsCache : null,
-      );
+      const fallbackCache = this.readFileWithCache(DEFAULT_INSTRUCTIONS_PATH, false, "default instructions");
 
       if (fallbackCache.hash !== "missing") {
         cache = fallbackCache;
@@ -365,13 +352,22 @@ export class SystemPromptManager {
       this.instructionsWarningLogged = false;
     }
 
-    this.instructionsCache = cache;
     if (this.lastInstructionsHash && cache.hash !== this.lastInstructionsHash && cache.hash !== "missing") {
       this.pendingReason = this.pendingReason ?? "instructions-updated";
     }
     return cache;
   }
 
+  private readSoul(): FileCache {
+    let soulPath: string;
+    try {
+      soulPath = resolveSoulPath(this.workspaceRoot);
+    } catch {
+      return { path: "", mtimeMs: 0, size: 0, content: "", hash: "missing" };
+    }
+    return this.readFileWithCache(soulPath, false, "soul");
+  }
+
   private checkWorkspaceInitialized(workspaceRoot: string): boolean {
     migrateLegacyWorkspaceAdsIfNeeded(workspaceRoot);
     return fs.existsSync(resolveWorkspaceStatePath(workspaceRoot, "workspace.json"));
@@ -407,15 +403,16 @@ export class SystemPromptManager {
     let cache: FileCache | null = null;
 
     if (fs.existsSync(rulesPath)) {
-      cache = this.readFileWithCache(rulesPath, false, "workspace rules", this.rulesCache);
+      cache = this.readFileWithCache(rulesPath, false, "workspace rules");
     } else if (fs.existsSync(templateRules)) {
-      cache = this.readFileWithCache(templateRules, false, "template rules", this.rulesCache);
+      cache = this.readFileWithCache(templateRules, false, "template rules");
     } else {
       cache = {
         path: rulesPath,
         content: "",
         hash: "missing",
         mtimeMs: 0,
+        size: 0,
       };
     }
 
@@ -426,7 +423,6 @@ export class SystemPromptManager {
       this.rulesWarningLogged = true;
     }
 
-    this.rulesCache = cache;
     if (this.lastRulesHash && cache.hash !== this.lastRulesHash && cache.hash !== "missing") {
       this.pendingReason = this.pendingReason ?? "rules-updated";
     }
@@ -438,25 +434,32 @@ export class SystemPromptManager {
     return cache;
   }
 
-  private readFileWithCache(
-    filePath: string,
-    required: boolean,
-    label: string,
-    cache: FileCache | null,
-  ): FileCache {
+  private readFileWithCache(filePath: string, required: boolean, label: string): FileCache {
     try {
       const stats = fs.statSync(filePath);
-      if (cache && cache.path === filePath && cache.mtimeMs === stats.mtimeMs) {
-        return cache;
+      const cached = sharedFileCache.get(filePath);
+      if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+        return cached;
       }
       const content = fs.readFileSync(filePath, "utf-8");
-      return {
+      const next: FileCache = {
         path: filePath,
         mtimeMs: stats.mtimeMs,
+        size: stats.size,
         content,
         hash: crypto.createHash("sha1").update(content).digest("hex"),
       };
+      sharedFileCache.delete(filePath);
+      if (sharedFileCache.size >= MAX_SHARED_FILE_CACHE_ENTRIES) {
+        const oldest = sharedFileCache.keys().next().value;
+        if (oldest !== undefined) {
+          sharedFileCache.delete(oldest);
+        }
+      }
+      sharedFileCache.set(filePath, next);
+      return next;
     } catch (error) {
+      sharedFileCache.delete(filePath);
       if (required) {
         throw new Error(
           `[SystemPrompt] 无法读取 ${label}: ${filePath}`,
@@ -466,6 +469,7 @@ export class SystemPromptManager {
       return {
         path: filePath,
         mtimeMs: 0,
+        size: 0,
         content: "",
         hash: "missing",
       };
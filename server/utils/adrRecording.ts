@@ -86,6 +86,9 @@ function slugifyTitle(title: string): string {
 
 function extractAdrBlocks(text: string): { blocks: ExtractedAdrBlock[]; cleanedText: string } {
   const blocks: ExtractedAdrBlock[] = [];
+  if (!text.includes("<<<adr")) {
+    return { blocks, cleanedText: text };
+  }
   const regex = /<<<adr[ \t]*\r?\n([\s\S]*?)\r?\n>>>/g;
 
   let cursor = 0;
@@ -54,6 +54,7 @@ export class HistoryStore {
   private store = new Map<string, HistoryEntry[]>();
   private db: DatabaseType | null = null;
   private useSqlite = false;
+  private storageDirReady = false;
 
   private insertStmt?: SqliteStatement;
   private selectStmt?: SqliteStatement;
@@ -322,13 +323,25 @@ export class HistoryStore {
 
   private persist(): void {
     try {
-      const dir = path.dirname(this.storagePath);
-      fs.mkdirSync(dir, { recursive: true });
+      if (!this.storageDirReady) {
+        fs.mkdirSync(path.dirname(this.storagePath), { recursive: true });
+        this.storageDirReady = true;
+      }
       const obj: Record<string, HistoryEntry[]> = {};
       for (const [key, items] of this.store.entries()) {
         obj[key] = this.trim(items);
       }
-      fs.writeFileSync(this.storagePath, JSON.stringify(obj, null, 2), "utf8");
+      const payload = JSON.stringify(obj, null, 2);
+      try {
+        fs.writeFileSync(this.storagePath, payload, "utf8");
+      } catch (error) {
+        if ((error as NodeJS.ErrnoException).code !== "ENOENT") {
+          throw error;
+        }
+        // The directory was removed after we created it; recreate it and retry once.
+        fs.mkdirSync(path.dirname(this.storagePath), { recursive: true });
+        fs.writeFileSync(this.storagePath, payload, "utf8");
+      }
     } catch (error) {
       logger.warn(`[HistoryStore] Failed to persist ${this.storagePath}`, error);
     }
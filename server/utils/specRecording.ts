@@ -42,6 +42,9 @@ interface SpecBlockRecord {
 
 function extractSpecBlocks(text: string): { blocks: ExtractedSpecBlock[]; cleanedText: string } {
   const blocks: ExtractedSpecBlock[] = [];
+  if (!text.includes("<<<spec")) {
+    return { blocks, cleanedText: text };
+  }
   const regex = /<<<spec[ \t]*\r?\n([\s\S]*?)\r?\n>>>/g;
 
   let cursor = 0;
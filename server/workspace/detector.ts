@@ -18,7 +18,9 @@ const REQUIRED_TEMPLATE_FILES = [
   "implementation.md",
   "task.md",
 ];
-const LEGACY_TEMPLATE_DIRS = ["nodes", "workflows"];
+const LEGACY_TEMPLATE_DIRS: ReadonlySet<string> = new Set(["nodes", "workflows"]);
+// A templates path that does not exist means "no templates"; an existing but unreadable directory must still fail.
+const TEMPLATE_DIR_MISSING_CODES: ReadonlySet<string> = new Set(["ENOENT", "ENOTDIR"]);
 const logger = createLogger("WorkspaceDetector");
 
 function existsSync(target: string): boolean {
@@ -35,10 +37,16 @@ function resolveAbsolute(target: string): string {
 }
 
 function listTemplateFiles(): string[] {
-  if (!existsSync(TEMPLATE_ROOT_DIR)) {
-    return [];
+  let entries: fs.Dirent[];
+  try {
+    entries = fs.readdirSync(TEMPLATE_ROOT_DIR, { withFileTypes: true });
+  } catch (error) {
+    const code = (error as NodeJS.ErrnoException).code;
+    if (code && TEMPLATE_DIR_MISSING_CODES.has(code)) {
+      return [];
+    }
+    throw error;
   }
-  const entries = fs.readdirSync(TEMPLATE_ROOT_DIR, { withFileTypes: true });
   const unexpectedDirs = entries.filter((entry) => entry.isDirectory());
   if (unexpectedDirs.length > 0) {
     logger.warn(
@@ -48,7 +56,8 @@ function listTemplateFiles(): string[] {
     );
   }
   const files = entries.filter((entry) => entry.isFile()).map((entry) => entry.name);
-  const missing = REQUIRED_TEMPLATE_FILES.filter((file) => !files.includes(file));
+  const fileSet = new Set(files);
+  const missing = REQUIRED_TEMPLATE_FILES.filter((file) => !fileSet.has(file));
   if (missing.length > 0) {
     throw new Error(`templates/ 缺少必需文件: ${missing.join(", ")}`);
   }
@@ -60,7 +69,7 @@ function hasLegacyStructure(dir: string): boolean {
     return false;
   }
   const entries = fs.readdirSync(dir, { withFileTypes: true });
-  return entries.some((entry) => entry.isDirectory() || LEGACY_TEMPLATE_DIRS.includes(entry.name));
+  return entries.some((entry) => entry.isDirectory() || LEGACY_TEMPLATE_DIRS.has(entry.name));
 }
 
 function backupLegacyTemplates(dir: string): void {
@@ -73,12 +82,15 @@ function backupLegacyTemplates(dir: string): void {
 }
 
 function filesEqual(a: string, b: string): boolean {
-  if (!existsSync(a) || !existsSync(b)) {
+  try {
+    // A size mismatch settles it without reading either file.
+    if (fs.statSync(a).size !== fs.statSync(b).size) {
+      return false;
+    }
+    return fs.readFileSync(a).equals(fs.readFileSync(b));
+  } catch {
     return false;
   }
-  const source = fs.readFileSync(a);
-  const target = fs.readFileSync(b);
-  return source.equals(target);
 }
 
 function copyDefaultTemplates(workspaceRoot: string): void {
@@ -94,22 +106,24 @@ function copyDefaultTemplates(workspaceRoot: string): void {
   fs.mkdirSync(templatesRoot, { recursive: true });
 
   const srcSet = new Set(templateFiles);
-  for (const entry of fs.readdirSync(templatesRoot)) {
-    const entryPath = path.join(templatesRoot, entry);
-    const stat = fs.statSync(entryPath);
-    if (stat.isDirectory()) {
+  const existingFiles = new Set<string>();
+  for (const entry of fs.readdirSync(templatesRoot, { withFileTypes: true })) {
+    const entryPath = path.join(templatesRoot, entry.name);
+    if (entry.isDirectory()) {
       fs.rmSync(entryPath, { recursive: true, force: true });
       continue;
     }
-    if (!srcSet.has(entry)) {
+    if (!srcSet.has(entry.name)) {
       fs.rmSync(entryPath, { force: true });
+      continue;
     }
+    existingFiles.add(entry.name);
   }
 
   for (const file of templateFiles) {
     const srcPath = path.join(TEMPLATE_ROOT_DIR, file);
     const destPath = path.join(templatesRoot, file);
-    if (filesEqual(srcPath, destPath)) {
+    if (existingFiles.has(file) && filesEqual(srcPath, destPath)) {
       continue;
     }
     fs.copyFileSync(srcPath, destPath);
@@ -117,8 +131,14 @@ function copyDefaultTemplates(workspaceRoot: string): void {
 
   const workspaceRulesPath = resolveWorkspaceStatePath(workspaceRoot, "rules.md");
   const defaultRulesPath = path.join(templatesRoot, "rules.md");
-  if (!existsSync(workspaceRulesPath) && existsSync(defaultRulesPath)) {
-    fs.copyFileSync(defaultRulesPath, workspaceRulesPath);
+  try {
+    // COPYFILE_EXCL keeps user-edited rules; a missing default template is not an error.
+    fs.copyFileSync(defaultRulesPath, workspaceRulesPath, fs.constants.COPYFILE_EXCL);
+  } catch (error) {
+    const code = (error as NodeJS.ErrnoException).code;
+    if (code !== "EEXIST" && code !== "ENOENT") {
+      throw error;
+    }
   }
 }
 
@@ -6,31 +6,54 @@ import { migrateLegacyWorkspaceAdsIfNeeded, resolveWorkspaceStatePath } from "./
 import { safeStringify } from "../utils/json.js";
 import { PROJECT_ROOT } from "../utils/projectRoot.js";
 const TEMPLATE_RULES_PATH = path.join(PROJECT_ROOT, "templates", "rules.md");
+const PROTECTED_DATA_FILE_SUFFIXES = [".db", ".sqlite", ".sqlite3", "index.json"] as const;
+const RULE_NUMBER_PREFIX_REGEX = /^\d+\.\s*/;
+
+interface RulesFileCacheEntry {
+  mtimeMs: number;
+  size: number;
+  content: string;
+}
+
+interface RuleEntry {
+  title: string;
+  category: string | null;
+  priority: "critical" | "normal";
+  description: string;
+}
+
+// Rules are re-read on every /rules command; only hit the disk again when the file changes.
+const rulesFileCache = new Map<string, RulesFileCacheEntry>();
 
 function readFileIfExists(filePath: string): string | null {
   try {
-    return fs.readFileSync(filePath, "utf-8");
+    const stats = fs.statSync(filePath);
+    const cached = rulesFileCache.get(filePath);
+    if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+      return cached.content;
+    }
+    const content = fs.readFileSync(filePath, "utf-8");
+    rulesFileCache.set(filePath, { mtimeMs: stats.mtimeMs, size: stats.size, content });
+    return content;
   } catch {
+    rulesFileCache.delete(filePath);
     return null;
   }
 }
 
-export async function readRules(workspacePath?: string): Promise<string> {
+function resolveRulesSource(workspacePath?: string): { source: "workspace" | "template"; targetPath: string; content: string } {
   const workspace = workspacePath ? path.resolve(workspacePath) : detectWorkspace();
   migrateLegacyWorkspaceAdsIfNeeded(workspace);
   const workspaceRules = resolveWorkspaceStatePath(workspace, "rules.md");
-  const templateRules = TEMPLATE_RULES_PATH;
-
-  let source = "template";
-  let targetPath = templateRules;
-  let content = readFileIfExists(workspaceRules);
-
+  const content = readFileIfExists(workspaceRules);
   if (content) {
-    source = "workspace";
-    targetPath = workspaceRules;
-  } else {
-    content = readFileIfExists(templateRules) ?? "";
+    return { source: "workspace", targetPath: workspaceRules, content };
   }
+  return { source: "template", targetPath: TEMPLATE_RULES_PATH, content: readFileIfExists(TEMPLATE_RULES_PATH) ?? "" };
+}
+
+export async function readRules(workspacePath?: string): Promise<string> {
+  const { source, targetPath, content } = resolveRulesSource(workspacePath);
 
   const result = [
     "# 项目规则",
@@ -49,12 +72,13 @@ export async function readRules(workspacePath?: string): Promise<string> {
 
 export async function listRules(params: { workspace_path?: string; category?: string }): Promise<string> {
   const { workspace_path: workspacePath, category } = params;
-  const rulesContent = await readRules(workspacePath);
+  // Parse the rules file itself; the header readRules adds carries no rule headings.
+  const rulesContent = resolveRulesSource(workspacePath).content;
 
   const lines = rulesContent.split(/\r?\n/);
-  const rules: Array<Record<string, unknown>> = [];
+  const rules: RuleEntry[] = [];
   let currentCategory: string | null = null;
-  let currentRule: Record<string, unknown> | null = null;
+  let currentRule: RuleEntry | null = null;
 
   for (const line of lines) {
     if (line.startsWith("## ")) {
@@ -65,7 +89,7 @@ export async function listRules(params: { workspace_path?: string; category?: st
       if (currentRule) {
         rules.push(currentRule);
       }
-      const title = line.slice(4).trim().replace(/^\d+\.\s*/, "");
+      const title = line.slice(4).trim().replace(RULE_NUMBER_PREFIX_REGEX, "");
       currentRule = {
         title,
         category: currentCategory,
@@ -83,12 +107,9 @@ export async function listRules(params: { workspace_path?: string; category?: st
     rules.push(currentRule);
   }
 
-  const filtered = category
-    ? rules.filter((rule) =>
-        String(rule.category ?? "")
-          .toLowerCase()
-          .includes(category.toLowerCase()),
-      )
+  const categoryNeedle = category?.toLowerCase();
+  const filtered = categoryNeedle
+    ? rules.filter((rule) => (rule.category ?? "").toLowerCase().includes(categoryNeedle))
     : rules;
 
   return safeStringify({
@@ -108,7 +129,7 @@ export async function checkRuleViolation(params: {
   if (operation === "delete_file") {
     const filePath = String(details.file_path ?? "");
     const normalized = filePath.toLowerCase();
-    if ([".db", ".sqlite", ".sqlite3", "index.json"].some((ext) => normalized.endsWith(ext))) {
+    if (PROTECTED_DATA_FILE_SUFFIXES.some((ext) => normalized.endsWith(ext))) {
       violations.push({
         rule: "禁止删除数据库文件",
         severity: "critical",
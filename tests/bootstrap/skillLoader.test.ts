@@ -0,0 +1,46 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+import fs from "node:fs";
+import os from "node:os";
+import path from "node:path";
+
+import { SkillLoader, resetSkillLoaderFileCacheForTests } from "../../server/bootstrap/skills/skillLoader.js";
+import { resolveWorkspaceStatePath } from "../../server/workspace/adsPaths.js";
+import { installTempAdsStateDir } from "../helpers/adsStateDir.js";
+
+test("shares skill file reads across loader instances and re-reads rewritten files", (t) => {
+  const adsState = installTempAdsStateDir("ads-state-bootstrap-skills-");
+  const workspaceRoot = fs.mkdtempSync(path.join(os.tmpdir(), "ads-bootstrap-skills-"));
+  t.after(() => {
+    resetSkillLoaderFileCacheForTests();
+    adsState.restore();
+    fs.rmSync(workspaceRoot, { recursive: true, force: true });
+  });
+  resetSkillLoaderFileCacheForTests();
+
+  const skillPath = resolveWorkspaceStatePath(workspaceRoot, "templates", "skills", "executor.md");
+  fs.mkdirSync(path.dirname(skillPath), { recursive: true });
+  fs.writeFileSync(skillPath, "Executor v1", "utf8");
+
+  let skillReads = 0;
+  const readFileSync = fs.readFileSync;
+  t.mock.method(fs, "readFileSync", (...args: Parameters<typeof fs.readFileSync>) => {
+    if (path.resolve(String(args[0])) === path.resolve(skillPath)) {
+      skillReads += 1;
+    }
+    return readFileSync(...args);
+  });
+
+  const first = new SkillLoader().load("executor", { workspaceRoot });
+  const second = new SkillLoader().load("executor", { workspaceRoot });
+  assert.equal(first.source, "workspace");
+  assert.equal(second.text, "Executor v1");
+  assert.equal(second.hash, first.hash);
+  assert.equal(skillReads, 1, "second loader should reuse the first loader's read");
+
+  fs.writeFileSync(skillPath, "Executor v2 with more detail", "utf8");
+  const rewritten = new SkillLoader().load("executor", { workspaceRoot });
+  assert.equal(rewritten.text, "Executor v2 with more detail");
+  assert.notEqual(rewritten.hash, first.hash);
+  assert.equal(skillReads, 2);
+});
@@ -34,6 +34,25 @@ describe("skills/creator", () => {
     assert.equal(validated.valid, true, validated.message);
   });
 
+  it("fills every template placeholder in generated files", () => {
+    const created = initSkill({
+      workspaceRoot: workspace,
+      rawName: "Data Export",
+      resources: ["scripts", "references"],
+      includeExamples: true,
+    });
+
+    const skillMd = fs.readFileSync(path.join(created.skillDir, "SKILL.md"), "utf8");
+    assert.match(skillMd, /^name: data-export$/m);
+    assert.match(skillMd, /^# Data Export$/m);
+
+    const script = fs.readFileSync(path.join(created.skillDir, "scripts", "example.py"), "utf8");
+    const reference = fs.readFileSync(path.join(created.skillDir, "references", "api_reference.md"), "utf8");
+    for (const content of [skillMd, script, reference]) {
+      assert.doesNotMatch(content, /\{skill_(name|title)\}/);
+    }
+  });
+
   it("returns a validation error when SKILL.md is missing", () => {
     const dir = path.join(workspace, ".agent", "skills", "missing");
     fs.mkdirSync(dir, { recursive: true });
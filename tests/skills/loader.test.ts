@@ -8,6 +8,7 @@ import {
   discoverSkills,
   getSkillFileCacheSizeForTests,
   loadSkillBody,
+  readSkillBodies,
   renderCompactSkills,
   resetSkillFileCacheForTests,
   type SkillMetadata,
@@ -228,6 +229,20 @@ describe("skills/loader", () => {
     assert.equal(body, null);
   });
 
+  it("readSkillBodies resolves several discovered skills case-insensitively", () => {
+    const alpha = ["---", "name: alpha-skill", "description: Alpha", "---", "Alpha body"].join("\n");
+    const beta = ["---", "name: beta-skill", "description: Beta", "---", "Beta body"].join("\n");
+    createSkill(adsStateDir, "alpha-skill", alpha);
+    createSkill(adsStateDir, "beta-skill", beta);
+
+    const discovered = discoverSkills(workspaceRoot, NO_BUILTINS);
+    assert.deepEqual(readSkillBodies(["Alpha-Skill", "beta-skill", "missing-skill"], discovered), new Map([
+      ["Alpha-Skill", alpha],
+      ["beta-skill", beta],
+      ["missing-skill", null],
+    ]));
+  });
+
   it("removes stale cache entries after a discovered skill file is deleted", () => {
     createSkill(adsStateDir, "ephemeral-skill", [
       "---",
@@ -60,5 +60,37 @@ describe("skills/registryMetadata workspace overlay", () => {
     assert.equal(entry.priority, 100);
     assert.deepEqual(entry.provides, ["demo"]);
   });
+
+  it("reuses the parsed base file across workspaces and re-reads it when it changes", (t) => {
+    const basePath = path.join(adsStateDir, ".agent", "skills", "metadata.yaml");
+    writeRegistry(adsStateDir, ["mode: overlay", "skills:", "  base-skill:", "    priority: 1", ""].join("\n"));
+    const otherWorkspace = fs.mkdtempSync(path.join(os.tmpdir(), "ads-skill-registry-workspace-b-"));
+    t.after(() => fs.rmSync(otherWorkspace, { recursive: true, force: true }));
+    writeRegistry(workspaceRoot, ["mode: overlay", "skills:", "  skill-a:", "    priority: 10", ""].join("\n"));
+    writeRegistry(otherWorkspace, ["mode: overlay", "skills:", "  skill-b:", "    priority: 20", ""].join("\n"));
+
+    let baseReads = 0;
+    const readFileSync = fs.readFileSync;
+    t.mock.method(fs, "readFileSync", (...args: Parameters<typeof fs.readFileSync>) => {
+      if (path.resolve(String(args[0])) === basePath) {
+        baseReads += 1;
+      }
+      return readFileSync(...args);
+    });
+
+    const first = loadSkillRegistry(workspaceRoot);
+    const second = loadSkillRegistry(otherWorkspace);
+    const again = loadSkillRegistry(workspaceRoot);
+    assert.ok(first?.skills.has("skill-a"));
+    assert.ok(second?.skills.has("skill-b"));
+    assert.equal(second?.skills.has("skill-a"), false);
+    assert.ok(again?.skills.has("base-skill"));
+    assert.equal(baseReads, 1, "base metadata should be parsed once across workspaces");
+
+    writeRegistry(adsStateDir, ["mode: overlay", "skills:", "  base-skill:", "    priority: 1", "  added-skill:", "    priority: 2", ""].join("\n"));
+    const updated = loadSkillRegistry(otherWorkspace);
+    assert.ok(updated?.skills.has("added-skill"));
+    assert.equal(baseReads, 2);
+  });
 });
 
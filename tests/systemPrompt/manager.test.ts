@@ -1,10 +1,15 @@
-import { describe, it, before, after } from "node:test";
+import { describe, it, before, after, beforeEach } from "node:test";
 import assert from "node:assert/strict";
+import crypto from "node:crypto";
 import fs from "node:fs";
 import os from "node:os";
 import path from "node:path";
 
-import { SystemPromptManager } from "../../server/systemPrompt/manager.js";
+import {
+  SystemPromptManager,
+  getSystemPromptFileCacheSizeForTests,
+  resetSystemPromptFileCacheForTests,
+} from "../../server/systemPrompt/manager.js";
 import { resolveWorkspaceStatePath } from "../../server/workspace/adsPaths.js";
 import { installTempAdsStateDir, type TempAdsStateDir } from "../helpers/adsStateDir.js";
 import { setPreference } from "../../server/memory/soul.js";
@@ -30,6 +35,10 @@ describe("SystemPromptManager rule reinjection", () => {
     fs.rmSync(workspace, { recursive: true, force: true });
   });
 
+  beforeEach(() => {
+    resetSystemPromptFileCacheForTests();
+  });
+
   it("re-injects rules every five turns", () => {
     const manager = new SystemPromptManager({
       workspaceRoot: workspace,
@@ -107,6 +116,55 @@ describe("SystemPromptManager rule reinjection", () => {
     fs.rmSync(nextWorkspace, { recursive: true, force: true });
   });
 
+  it("shares prompt file reads across managers on one workspace", () => {
+    const sharedWorkspace = fs.mkdtempSync(path.join(os.tmpdir(), "ads-systemprompt-shared-"));
+    try {
+      const templatesDir = resolveWorkspaceStatePath(sharedWorkspace, "templates");
+      fs.mkdirSync(templatesDir, { recursive: true });
+      const instructionsPath = path.join(templatesDir, "instructions.md");
+      fs.writeFileSync(instructionsPath, "Shared instructions v1");
+      fs.writeFileSync(path.join(templatesDir, "rules.md"), "Shared rules");
+
+      const first = new SystemPromptManager({ workspaceRoot: sharedWorkspace }).maybeInject();
+      assert(first);
+      assert.match(first.text, /Shared instructions v1/);
+      const entriesAfterFirst = getSystemPromptFileCacheSizeForTests();
+
+      const unchanged = new SystemPromptManager({ workspaceRoot: sharedWorkspace }).maybeInject();
+      assert(unchanged);
+      assert.equal(unchanged.instructionsHash, first.instructionsHash);
+      assert.equal(getSystemPromptFileCacheSizeForTests(), entriesAfterFirst, "second manager should reuse cached entries");
+
+      const rewritten = "Shared instructions v2, rewritten";
+      fs.writeFileSync(instructionsPath, rewritten);
+      const second = new SystemPromptManager({ workspaceRoot: sharedWorkspace }).maybeInject();
+      assert(second);
+      assert.match(second.text, /Shared instructions v2, rewritten/);
+      assert.equal(second.instructionsHash, crypto.createHash("sha1").update(rewritten).digest("hex"));
+      assert.notEqual(second.instructionsHash, first.instructionsHash);
+    } finally {
+      fs.rmSync(sharedWorkspace, { recursive: true, force: true });
+    }
+  });
+
+  it("caps the shared prompt file cache at 256 entries", () => {
+    const root = fs.mkdtempSync(path.join(os.tmpdir(), "ads-systemprompt-cap-"));
+    try {
+      // Each workspace contributes its instructions and rules files.
+      for (let i = 0; i < 140; i += 1) {
+        const ws = path.join(root, `ws-${i}`);
+        const templatesDir = resolveWorkspaceStatePath(ws, "templates");
+        fs.mkdirSync(templatesDir, { recursive: true });
+        fs.writeFileSync(path.join(templatesDir, "instructions.md"), `Instructions ${i}`);
+        fs.writeFileSync(path.join(templatesDir, "rules.md"), `Rules ${i}`);
+        new SystemPromptManager({ workspaceRoot: ws }).maybeInject();
+      }
+      assert.equal(getSystemPromptFileCacheSizeForTests(), 256);
+    } finally {
+      fs.rmSync(root, { recursive: true, force: true });
+    }
+  });
+
   it("injects soul content into prompt", () => {
     setPreference(workspace, "language", "中文");
     setPreference(workspace, "tone", "casual");
@@ -71,6 +71,29 @@ describe("workspace/detector", () => {
     assert.ok(files.includes("rules.md"), "rules template should exist");
   });
 
+  it("never overwrites customized workspace rules when templates are re-synced", (t) => {
+    initializeWorkspace(workspace, "Rules Preservation Test");
+    const rulesPath = resolveWorkspaceStatePath(workspace, "rules.md");
+    assert.equal(fs.existsSync(rulesPath), true, "rules.md should be seeded on init");
+
+    const customRules = "# Custom rules\n\nKeep me.\n";
+    fs.writeFileSync(rulesPath, customRules, "utf8");
+    ensureDefaultTemplates(workspace);
+    assert.equal(fs.readFileSync(rulesPath, "utf8"), customRules, "existing rules.md must not be replaced");
+
+    // A default rules template that disappears mid-sync is tolerated rather than failing setup.
+    fs.rmSync(rulesPath);
+    const copyFileSync = fs.copyFileSync;
+    t.mock.method(fs, "copyFileSync", (src: fs.PathLike, dest: fs.PathLike, mode?: number) => {
+      if (path.resolve(String(dest)) === path.resolve(rulesPath)) {
+        throw Object.assign(new Error(`ENOENT: no such file or directory, copyfile '${String(src)}'`), { code: "ENOENT" });
+      }
+      return copyFileSync(src, dest, mode);
+    });
+    assert.doesNotThrow(() => ensureDefaultTemplates(workspace));
+    assert.equal(fs.existsSync(rulesPath), false);
+  });
+
   it("detects workspace root from a nested directory", () => {
     initializeWorkspace(workspace, "Nested Detector Test");
     fs.mkdirSync(path.join(workspace, ".git"), { recursive: true });
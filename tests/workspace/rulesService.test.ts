@@ -48,6 +48,16 @@ describe("workspace/rulesService", () => {
     assert.ok(output.includes("禁止删除 .db 文件"), "should include rule body");
   });
 
+  it("picks up edits to the workspace rules file between reads", async () => {
+    const rulesPath = resolveWorkspaceStatePath(workspace, "rules.md");
+    assert.ok((await readRules(workspace)).includes("遵守 ESLint"));
+
+    fs.writeFileSync(rulesPath, "# 项目规则\n## 一般规则\n### 1. 新规则\n**规则**: 使用 Prettier 格式化\n", "utf-8");
+    const updated = await readRules(workspace);
+    assert.ok(updated.includes("使用 Prettier 格式化"));
+    assert.ok(!updated.includes("遵守 ESLint"));
+  });
+
   it("lists rules filtered by category", async () => {
     const json = await listRules({ workspace_path: workspace, category: "禁止" });
     const parsed = JSON.parse(json) as { total?: number; rules?: Array<Record<string, unknown>> };